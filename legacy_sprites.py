@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Procedural heart sprites for the relationship animation.
+
+These build multi-row ASCII hearts from a supersampled heart curve. The
+animation in relationship_animation.py draws single glyphs from its heart
+pools instead, so nothing here runs during the animation; the code is kept
+for potential future use (e.g. big ASCII-art hearts).
+
+Run
+    python legacy_sprites.py   # prints every size/style combination
+"""
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Tuple
+
+def heart_mask(width: int, height: int) -> List[List[float]]:
+    """Return a supersampled coverage mask (0..1) for a heart of given size.
+    Coverage improves shape fidelity at very small sizes.
+    """
+    mask: List[List[float]] = []
+    # Terminal cell aspect correction (wider horizontally for balance)
+    # Slightly different for tiny hearts
+    x_scale = 1.18 if width <= 9 else 1.12
+    y_scale = 1.0
+    # Shrink the heart slightly within the cell grid to leave a margin
+    # so curves are more visible and not clipped at edges
+    shrink = 0.90 if width <= 7 else 0.95
+    # Small threshold relax for tiny hearts
+    base_threshold = 0.01 if width <= 7 else 0.0
+
+    # Supersampling grid size (performance-friendly)
+    ss = 4 if width <= 9 else 3  # higher for small-to-medium hearts to improve edges
+    inv = 1.0 / ss
+    row_span = max(1.0, height - 1.0)
+    col_span = max(1.0, width - 1.0)
+
+    # All per-sample coordinate math depends on only one axis, so map every
+    # row/column position to curve space once up front; the inner loops are
+    # then left with nothing but the curve polynomial.
+    def _to_x(fc: float) -> float:
+        return (-1.0 + 2.0 * fc) * (x_scale * shrink)
+
+    def _to_y(fr: float) -> float:
+        return (1.0 - 2.0 * fr) * (y_scale * shrink)
+
+    def _inside(x: float, y: float) -> bool:
+        v = (x * x + y * y - 1.0)
+        return (v * v * v - x * x * (y * y * y)) <= base_threshold
+
+    # Subsample centers within each cell, per column and per row
+    sub_xs = [[_to_x((col + (sc + 0.5) * inv) / col_span) for sc in range(ss)]
+              for col in range(width)]
+    sub_ys = [[_to_y((row + (sr + 0.5) * inv) / row_span) for sr in range(ss)]
+              for row in range(height)]
+    # Inside test at every cell corner; each corner is shared by up to 4 cells
+    edge_xs = [_to_x(col / col_span) for col in range(width + 1)]
+    corners = [[_inside(x, _to_y(row / row_span)) for x in edge_xs]
+               for row in range(height + 1)]
+
+    for row in range(height):
+        line: List[float] = []
+        top, bottom, ys = corners[row], corners[row + 1], sub_ys[row]
+        for col in range(width):
+            # Cells whose four corners agree are (almost always) fully inside
+            # or outside the curve; only supersample cells on the boundary.
+            n = top[col] + top[col + 1] + bottom[col] + bottom[col + 1]
+            if n == 4:
+                line.append(1.0)
+                continue
+            if n == 0:
+                line.append(0.0)
+                continue
+            inside_count = 0
+            for y in ys:
+                for x in sub_xs[col]:
+                    if _inside(x, y):
+                        inside_count += 1
+            coverage = inside_count / float(ss * ss)
+            line.append(coverage)
+        mask.append(line)
+    return mask
+
+def mask_to_sprite(mask: List[List[float]], style: str = "filled") -> List[str]:
+    h = len(mask)
+    w = len(mask[0]) if h else 0
+    # Characters for drawing (smaller visual footprint for clearer tiny hearts)
+    fill_char = "•"     # small bullet for fill
+    mid_char = "·"      # middle dot for soft edges
+    outline_char = "·"  # outline uses dot as well
+
+    rows: List[str] = []
+    # Helper to decide char from coverage
+    def char_from_coverage(cov: float, mode: str) -> str:
+        if mode == "outline":
+            # Consider boundary band
+            return outline_char if 0.25 <= cov <= 0.75 else (" " if cov < 0.25 else " ")
+        # filled
+        if cov >= 0.66:
+            return fill_char
+        elif cov >= 0.3:
+            return mid_char
+        else:
+            return " "
+
+    for r in range(h):
+        line_chars: List[str] = []
+        for c in range(w):
+            cov = mask[r][c]
+            line_chars.append(char_from_coverage(cov, style))
+        rows.append("".join(line_chars).rstrip())  # trim trailing spaces per row
+    # Remove empty rows at top/bottom to tighten sprite
+    while rows and rows[0].strip() == "":
+        rows.pop(0)
+    while rows and rows[-1].strip() == "":
+        rows.pop()
+    # Normalize width by padding to the max width among rows
+    maxw = max((len(r) for r in rows), default=0)
+    rows = [r + " " * (maxw - len(r)) for r in rows]
+    return rows
+
+@lru_cache(maxsize=None)
+def make_heart_sprite(size: str, style: str) -> Tuple[str, ...]:
+    # Choose base sizes per category (larger for better shape recognition)
+    if size == "small":
+        w, h = 9, 8
+    elif size == "medium":
+        w, h = 13, 11
+    else:  # large
+        w, h = 17, 15
+    return tuple(mask_to_sprite(heart_mask(w, h), style))
+
+
+if __name__ == "__main__":
+    for size in ("small", "medium", "large"):
+        for style in ("filled", "outline"):
+            print(f"{size} / {style}")
+            print("\n".join(make_heart_sprite(size, style)))
+            print()
@@ -22,10 +22,11 @@ from __future__ import annotations
 import os
 import random
 import shutil
+import signal
 import sys
 import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
 import math
 
 # Try to enable ANSI colors on Windows automatically
@@ -61,6 +62,28 @@ PINKS = [
     "\x1b[38;5;219m",  # very light pink
 ]
 
+# Style prefix per twinkle phase: 0 normal, 1 bright, 2 faint
+TWINKLE_STYLES = ("", BOLD, FAINT)
+TWINKLE_PHASES = (0, 1, 2)
+
+# Rendered heart cells, one per twinkle phase, keyed by (color, glyph). The
+# product is small (7 colors x a handful of glyphs), so each set of cell
+# strings is built once and shared by every heart with that look.
+_CELL_CACHE: Dict[Tuple[str, str], Tuple[str, str, str]] = {}
+
+
+def render_cells(color: str, ch: str) -> Tuple[str, str, str]:
+    """Return the ready-to-print cell for a glyph in each twinkle phase."""
+    key = (color, ch)
+    cells = _CELL_CACHE.get(key)
+    if cells is None:
+        cells = _CELL_CACHE[key] = (
+            f"{TWINKLE_STYLES[0]}{color}{ch}{RESET}",
+            f"{TWINKLE_STYLES[1]}{color}{ch}{RESET}",
+            f"{TWINKLE_STYLES[2]}{color}{ch}{RESET}",
+        )
+    return cells
+
 # Heart glyph pools (use provided hearts instead of procedural)
 # Small/outline/dainty
 HEARTS_SMALL = ["♡", "❥", "ღ"]
@@ -69,97 +92,15 @@ HEARTS_MED = ["♥" ]#, "❤", "❣"]
 # Large emoji hearts (pink variants)
 HEARTS_LARGE = ["💖", "💗", "💕", "💞", "💓", "💝", "💟"]
 
-# Procedural heart functions are kept for potential future use but aren't required
-# when using the glyph pools above.
+# Spawn picks: first entry is chosen with probability SPAWN_BIAS (favor small
+# filled hearts to reduce clutter), compared against a single random() draw.
+_SIZE_POP = ("small", "medium")
+_STYLE_POP = ("filled", "outline")
+SPAWN_BIAS = 0.6
+
+# Procedural heart sprites (heart_mask/mask_to_sprite/make_heart_sprite) live in
+# legacy_sprites.py; the animation only needs the glyph pools above.
 
-def heart_mask(width: int, height: int) -> List[List[float]]:
-    """Return a supersampled coverage mask (0..1) for a heart of given size.
-    Coverage improves shape fidelity at very small sizes.
-    """
-    mask: List[List[float]] = []
-    # Terminal cell aspect correction (wider horizontally for balance)
-    # Slightly different for tiny hearts
-    x_scale = 1.18 if width <= 9 else 1.12
-    y_scale = 1.0
-    # Shrink the heart slightly within the cell grid to leave a margin
-    # so curves are more visible and not clipped at edges
-    shrink = 0.90 if width <= 7 else 0.95
-    # Small threshold relax for tiny hearts
-    base_threshold = 0.01 if width <= 7 else 0.0
-
-    # Supersampling grid size (performance-friendly)
-    ss = 4 if width <= 9 else 3  # higher for small-to-medium hearts to improve edges
-    inv = 1.0 / ss
-
-    for row in range(height):
-        line: List[float] = []
-        for col in range(width):
-            inside_count = 0
-            for sr in range(ss):
-                for sc in range(ss):
-                    # Center subsamples within the cell
-                    fr = (row + (sr + 0.5) * inv) / max(1.0, height - 1.0)
-                    fc = (col + (sc + 0.5) * inv) / max(1.0, width - 1.0)
-                    y = 1.0 - 2.0 * fr
-                    x = -1.0 + 2.0 * fc
-                    x *= (x_scale * shrink)
-                    y *= (y_scale * shrink)
-                    v = (x * x + y * y - 1.0)
-                    inside = (v * v * v - x * x * (y * y * y)) <= base_threshold
-                    if inside:
-                        inside_count += 1
-            coverage = inside_count / float(ss * ss)
-            line.append(coverage)
-        mask.append(line)
-    return mask
-
-def mask_to_sprite(mask: List[List[float]], style: str = "filled") -> List[str]:
-    h = len(mask)
-    w = len(mask[0]) if h else 0
-    # Characters for drawing (smaller visual footprint for clearer tiny hearts)
-    fill_char = "•"     # small bullet for fill
-    mid_char = "·"      # middle dot for soft edges
-    outline_char = "·"  # outline uses dot as well
-
-    rows: List[str] = []
-    # Helper to decide char from coverage
-    def char_from_coverage(cov: float, mode: str) -> str:
-        if mode == "outline":
-            # Consider boundary band
-            return outline_char if 0.25 <= cov <= 0.75 else (" " if cov < 0.25 else " ")
-        # filled
-        if cov >= 0.66:
-            return fill_char
-        elif cov >= 0.3:
-            return mid_char
-        else:
-            return " "
-
-    for r in range(h):
-        line_chars: List[str] = []
-        for c in range(w):
-            cov = mask[r][c]
-            line_chars.append(char_from_coverage(cov, style))
-        rows.append("".join(line_chars).rstrip())  # trim trailing spaces per row
-    # Remove empty rows at top/bottom to tighten sprite
-    while rows and rows[0].strip() == "":
-        rows.pop(0)
-    while rows and rows[-1].strip() == "":
-        rows.pop()
-    # Normalize width by padding to the max width among rows
-    maxw = max((len(r) for r in rows), default=0)
-    rows = [r + " " * (maxw - len(r)) for r in rows]
-    return rows
-
-def make_heart_sprite(size: str, style: str) -> List[str]:
-    # Choose base sizes per category (larger for better shape recognition)
-    if size == "small":
-        w, h = 9, 8
-    elif size == "medium":
-        w, h = 13, 11
-    else:  # large
-        w, h = 17, 15
-    return mask_to_sprite(heart_mask(w, h), style)
 MESSAGES = [
     "Compiling feelings...",
     "Deploying emotions...",
@@ -174,6 +115,11 @@ MESSAGES = [
 
 @dataclass
 class Heart:
+    # Explicit slots (rather than dataclass(slots=True), which needs 3.10+)
+    # drop the per-instance __dict__ from every falling heart
+    __slots__ = ("x", "y", "color", "speed", "size", "style", "sprite",
+                 "w", "h", "twinkle_phase", "twinkle_next", "rendered")
+
     x: int
     y: float
     color: str
@@ -184,33 +130,105 @@ class Heart:
     w: int
     h: int
     twinkle_phase: int  # 0 normal, 1 bright, 2 faint
-    twinkle_next: float
+    twinkle_next: int  # monotonic_ns deadline
+    rendered: Tuple[str, str, str]  # cell per twinkle phase, see render_cells
 
     def step(self):
         self.y += self.speed
 
 
+Bounds = Tuple[int, int, int, int]  # (left, right, top, bottom)
+
+
+def heart_bounds(h: Heart) -> Bounds:
+    """Return the integer bounding box of a heart on the screen grid."""
+    left = int(h.x) - h.w // 2
+    top = int(h.y)
+    return left, left + h.w, top, top + h.h
+
+
 def hearts_overlap(h1: Heart, h2: Heart) -> bool:
     """Check if two hearts overlap (bounding box collision)."""
-    # h1 bounds
-    h1_left = int(h1.x) - h1.w // 2
-    h1_right = h1_left + h1.w
-    h1_top = int(h1.y)
-    h1_bottom = h1_top + h1.h
-    # h2 bounds
-    h2_left = int(h2.x) - h2.w // 2
-    h2_right = h2_left + h2.w
-    h2_top = int(h2.y)
-    h2_bottom = h2_top + h2.h
-    # Check overlap
-    return not (h1_right < h2_left or h1_left > h2_right or 
-                h1_bottom < h2_top or h1_top > h2_bottom)
+    l1, r1, t1, b1 = heart_bounds(h1)
+    l2, r2, t2, b2 = heart_bounds(h2)
+    return r1 >= l2 and l1 <= r2 and b1 >= t2 and t1 <= b2
+
+
+# Spawn collision grid: hearts are bucketed into coarse cells so a new heart
+# is only tested against hearts that could actually touch it. Cells hold plain
+# bounds tuples so the test is just integer compares, no attribute lookups.
+GRID_CELL_W = 8
+GRID_CELL_H = 8
+
+Grid = Dict[Tuple[int, int], List[Bounds]]
+
+
+def grid_cells(bounds: Bounds) -> Iterator[Tuple[int, int]]:
+    """Yield every grid cell covered by a bounding box."""
+    left, right, top, bottom = bounds
+    for cy in range(top // GRID_CELL_H, bottom // GRID_CELL_H + 1):
+        for cx in range(left // GRID_CELL_W, right // GRID_CELL_W + 1):
+            yield cx, cy
+
+
+def grid_add(grid: Grid, bounds: Bounds) -> None:
+    for cell in grid_cells(bounds):
+        grid.setdefault(cell, []).append(bounds)
+
+
+def grid_collides(grid: Grid, bounds: Bounds) -> bool:
+    """Check a bounding box against only the boxes sharing one of its cells."""
+    left, right, top, bottom = bounds
+    for cell in grid_cells(bounds):
+        for l2, r2, t2, b2 in grid.get(cell, ()):
+            if right >= l2 and left <= r2 and bottom >= t2 and top <= b2:
+                return True
+    return False
+
+
+def spawn_columns(width: int, chance: float,
+                  rand: Callable[[], float] = random.random) -> Iterator[int]:
+    """Yield the columns that spawn a heart this frame, left to right.
+
+    Equivalent to testing random() < chance for every column, but jumps
+    straight from one hit to the next by drawing the geometric gap between
+    them, so the RNG runs about once per spawned heart instead of per column.
+    """
+    if chance <= 0.0:
+        return
+    if chance >= 1.0:
+        yield from range(width)
+        return
+    log_miss = math.log(1.0 - chance)
+    col = -1
+    while True:
+        # 1 - random() lies in (0, 1], so the log is always defined
+        col += 1 + int(math.log(1.0 - rand()) / log_miss)
+        if col >= width:
+            return
+        yield col
+
+
+# Terminal size lookups are a syscall, so keep the last answer around for a
+# short while: [size, monotonic_ns time it was read]. SIGWINCH expires it early.
+SIZE_TTL_NS = 500_000_000
+_size_cache: list = [None, 0]
 
 
 def get_size() -> Tuple[int, int]:
+    now = time.monotonic_ns()
+    if _size_cache[0] is not None and now - _size_cache[1] < SIZE_TTL_NS:
+        return _size_cache[0]
     size = shutil.get_terminal_size(fallback=(80, 24))
     # Reserve 2 lines for status/message
-    return max(20, size.columns), max(10, size.lines)
+    _size_cache[0] = (max(20, size.columns), max(10, size.lines))
+    _size_cache[1] = now
+    return _size_cache[0]
+
+
+def _on_resize(signum, frame) -> None:
+    # Force the next get_size() call to re-read the terminal size
+    _size_cache[1] = 0
 
 
 def center_text(text: str, width: int) -> str:
@@ -220,203 +238,267 @@ def center_text(text: str, width: int) -> str:
     return " " * pad + text
 
 
-def draw_frame(hearts: List[Heart], msg: str | None) -> None:
-    width, height = get_size()
-    # Build a buffer of spaces
-    buffer: List[List[str]] = [list(" " * width) for _ in range(height)]
+def write_out(text: str) -> None:
+    """Send a whole frame to the terminal in one write.
+
+    On POSIX the encoded frame goes straight to the stdout file descriptor,
+    skipping the text layer's per-call locking and buffering. Windows keeps
+    the regular stream so colorama's console handling still applies.
+    """
+    if os.name != "nt":
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = -1
+        if fd >= 0:
+            data = memoryview(text.encode(sys.stdout.encoding or "utf-8", "replace"))
+            while data:
+                data = data[os.write(fd, data):]
+            return
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+# Screen state from the last draw: heart cells by (row, col), the HUD and
+# message lines as written, and the size they were drawn at. Each frame only
+# erases/draws the hearts that moved and rewrites text lines that changed.
+Cells = Dict[Tuple[int, int], str]
+_prev_cells: Cells = {}
+_prev_hud: str | None = None
+_prev_msg: str | None = None
+_prev_size: Tuple[int, int] = (0, 0)
+
 
-    # Reserve top two lines for HUD
-    hud_line = 0
-    msg_line = 1
+def compose_hearts(hearts: List[Heart], width: int, height: int) -> Cells:
+    """Map each visible heart to its screen cell, clipping to the screen.
 
-    # Place hearts into the buffer (clip to screen)
+    Hearts are single-glyph, single-row sprites, so each one is exactly one
+    cell. Rows 0-1 belong to the HUD and are never drawn over.
+    """
+    cells: Cells = {}
     for h in hearts:
         top = int(h.y)
-        if top >= height:
-            continue
-        left = int(h.x) - h.w // 2
-        # Twinkle style
-        ansi_style = ""
-        if h.twinkle_phase == 1:
-            ansi_style = BOLD
-        elif h.twinkle_phase == 2:
-            ansi_style = FAINT
-
-        for r in range(h.h):
-            screen_r = top + r
-            if screen_r < 2 or screen_r >= height:
-                continue
-            row_str = h.sprite[r]
-            for c in range(h.w):
-                ch = row_str[c]
-                if ch == " ":
-                    continue
-                screen_c = left + c
-                if 0 <= screen_c < width:
-                    buffer[screen_r][screen_c] = f"{ansi_style}{h.color}{ch}{RESET}"
+        if 2 <= top < height:
+            left = int(h.x) - h.w // 2
+            if 0 <= left < width:
+                cells[top, left] = h.rendered[h.twinkle_phase]
+    return cells
+
+
+def emit_changes(out: List[str], cells: Cells, prev: Cells) -> None:
+    """Append cursor moves + cells that turn the prev hearts into cells."""
+    # Blank out cells a heart has left...
+    for pos in prev:
+        if pos not in cells:
+            out.append(f"{CSI}{pos[0] + 1};{pos[1] + 1}H ")
+    # ...then draw hearts that are new or look different
+    for pos, cell in cells.items():
+        if prev.get(pos) != cell:
+            out.append(f"{CSI}{pos[0] + 1};{pos[1] + 1}H{cell}")
+
+
+# Rendered HUD line per width and message line per (message, width); both
+# only change on resize or when a new message comes up.
+_hud_cache: Dict[int, str] = {}
+_msg_cache: Dict[Tuple[str, int], str] = {}
+
+
+def hud_text(width: int) -> str:
+    hud = _hud_cache.get(width)
+    if hud is None:
+        title = "Relationship Module: Rain of Hearts"
+        if len(title) + 22 < width:
+            hud = f"\x1b[96m{title}{RESET}" + "  |  Press Ctrl+C to exit"[:width - len(title)]
+        else:
+            hud = "Press Ctrl+C to exit"[:width]
+        _hud_cache[width] = hud
+    return hud
+
+
+def msg_text(msg: str, width: int) -> str:
+    key = (msg, width)
+    line = _msg_cache.get(key)
+    if line is None:
+        line = _msg_cache[key] = f"\x1b[95m{center_text(msg, width)}{RESET}"
+    return line
+
+
+def draw_frame(hearts: List[Heart], msg: str | None, width: int, height: int) -> None:
+    global _prev_cells, _prev_hud, _prev_msg, _prev_size
+    out: List[str] = []
+    if (width, height) != _prev_size:
+        # First frame or terminal resized: start over from a cleared screen
+        out.append(f"{CSI}H{CSI}2J")  # move cursor home + clear screen
+        _prev_cells = {}
+        _prev_hud = _prev_msg = None
+        _prev_size = (width, height)
+
+    # Hearts: only touch the cells that changed since the previous frame
+    cells = compose_hearts(hearts, width, height)
+    emit_changes(out, cells, _prev_cells)
+    _prev_cells = cells
 
     # HUD top line
-    title = "Relationship Module: Rain of Hearts"
-    hud_text = f"\x1b[96m{title}{RESET}  |  Press Ctrl+C to exit"
-    hud_text = hud_text if len(title) + 22 < width else "Press Ctrl+C to exit"
-    hud_text = hud_text[:width]
-    for i, ch in enumerate(hud_text):
-        buffer[hud_line][i] = ch
+    hud = hud_text(width)
+    if hud != _prev_hud:
+        out.append(f"{CSI}1;1H{CSI}2K{hud}")
+        _prev_hud = hud
 
     # Message line
-    if msg:
-        msg_colored = f"\x1b[95m{msg}{RESET}"
-        centered = center_text(msg_colored, width)
-        # Copy centered message into buffer
-        for i, ch in enumerate(centered[:width]):
-            buffer[msg_line][i] = ch
-
-    # Blit to screen in one go
-    out_lines: List[str] = ["".join(row) for row in buffer]
-    sys.stdout.write(f"{CSI}H{CSI}2J")  # move cursor home + clear screen
-    sys.stdout.write("\n".join(out_lines))
-    sys.stdout.flush()
+    msg_line = msg_text(msg, width) if msg else ""
+    if msg_line != _prev_msg:
+        out.append(f"{CSI}2;1H{CSI}2K{msg_line}")
+        _prev_msg = msg_line
 
+    if out:
+        out.append(f"{CSI}H")
+        write_out("".join(out))
 
-def main():
-    random.seed()
+
+def main(seed: int | None = None):
+    # One private RNG for the whole animation; pass a seed for a repeatable run
+    rng = random.Random(seed)
     # Animation parameters (will ramp up after intro)
     target_spawn_chance_per_col = 0.03   # lower density for larger hearts
     spawn_chance_per_col = 0.0           # start at zero, ramp up
-    ramp_duration = 10.0                 # seconds to reach target spawn chance
+    ramp_duration_ns = 10_000_000_000    # time to reach target spawn chance
 
     # speed range (slower overall, feels calmer)
     base_min_speed, base_max_speed = 0.06, 0.35  # slower overall for gentle fall
     fps = 14
-    frame_time = 1.0 / fps
+    # Frame pacing runs on integer monotonic_ns timestamps throughout
+    frame_time_ns = 1_000_000_000 // fps
 
     hearts: List[Heart] = []
-    next_msg_time = 0.0
+    next_msg_time = 0
     current_msg: str | None = None
-    msg_duration = 2.4
+    msg_duration_ns = 2_400_000_000
+
+    # Local aliases for the RNG calls made from the per-frame loops
+    rand = rng.random
+    rand_choice = rng.choice
+    rand_uniform = rng.uniform
+
+    # Pick up terminal resizes immediately where the platform reports them
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, _on_resize)
 
     # Enter alternate screen + hide cursor for a clean animation
     sys.stdout.write(ALT_SCREEN_ON + HIDE_CURSOR)
     sys.stdout.flush()
     try:
         # 1) Intro: show fun messages first with a tiny loading animation
-        intro_start = time.perf_counter()
-        intro_total = 7.0  # seconds
+        intro_start = time.monotonic_ns()
+        intro_total_ns = 7_000_000_000
         msg_index = 0
-        last = time.perf_counter()
+        last = time.monotonic_ns()
         while True:
-            now = time.perf_counter()
-            if now - intro_start >= intro_total:
+            now = time.monotonic_ns()
+            if now - intro_start >= intro_total_ns:
                 break
             # dot loader
-            dots = "." * int(((now - intro_start) * 3) % 4)
+            dots = "." * ((now - intro_start) * 3 // 1_000_000_000 % 4)
             intro_msg = MESSAGES[msg_index % len(MESSAGES)] + dots
-            msg_index += 1 if (now - last) > 0.6 else 0
+            msg_index += 1 if (now - last) > 600_000_000 else 0
             last = now
-            draw_frame([], intro_msg)
-            time.sleep(frame_time)
+            draw_frame([], intro_msg, *get_size())
+            time.sleep(frame_time_ns / 1e9)
 
         # 2) Main loop: slowly start falling hearts with twinkling
-        anim_start = time.perf_counter()
+        anim_start = time.monotonic_ns()
         last = anim_start
         while True:
-            now = time.perf_counter()
+            now = time.monotonic_ns()
             # Maintain a steady-ish frame rate
-            dt = max(0.0, now - last)
+            dt = max(0, now - last)
             last = now
 
             width, height = get_size()
 
-            # Step hearts
+            # Step, twinkle and cull hearts in a single pass, compacting the
+            # list in place and rebuilding the collision grid as we go
+            grid: Grid = {}
+            w_idx = 0
             for h in hearts:
                 # Use speed scaled by frame-time feel (not exact physics)
                 h.y += h.speed
                 # Twinkle: toggle style occasionally
                 if now >= h.twinkle_next:
-                    h.twinkle_phase = random.choice([0, 1, 2])
-                    h.twinkle_next = now + random.uniform(0.15, 0.6)
-
-            # Cull hearts off-screen
-            hearts = [h for h in hearts if h.y < height]
-
-            # Ramp up spawn chance smoothly from 0 to target over ramp_duration
+                    h.twinkle_phase = rand_choice(TWINKLE_PHASES)
+                    h.twinkle_next = now + int(rand_uniform(150_000_000, 600_000_000))
+                # Keep only hearts still on screen
+                if h.y < height:
+                    hearts[w_idx] = h
+                    w_idx += 1
+                    grid_add(grid, heart_bounds(h))
+            del hearts[w_idx:]
+
+            # Ramp up spawn chance smoothly from 0 to target over ramp_duration_ns
             elapsed = now - anim_start
-            if ramp_duration > 0:
+            if ramp_duration_ns > 0:
                 spawn_chance_per_col = min(target_spawn_chance_per_col,
-                                           target_spawn_chance_per_col * (elapsed / ramp_duration))
+                                           target_spawn_chance_per_col * (elapsed / ramp_duration_ns))
             else:
                 spawn_chance_per_col = target_spawn_chance_per_col
 
             # Spawn new hearts along the top row with some randomness (small + medium only)
-            for col in range(width):
-                if random.random() < spawn_chance_per_col:
-                    # pick size and style
-                    size_choice = random.choices(
-                        population=["small", "medium"],
-                        weights=[6, 4],  # favor small to reduce clutter
-                        k=1,
-                    )[0]
-                    style_choice = random.choices(
-                        population=["filled", "outline"],
-                        weights=[6, 4],
-                        k=1,
-                    )[0]
-
-                    # choose heart glyph from the provided pools
-                    if size_choice == "small":
-                        pool = HEARTS_SMALL if style_choice == "outline" else HEARTS_MED
-                        ch = random.choice(pool)
-                    else:  # medium
-                        ch = random.choice(HEARTS_MED)
-
-                    sprite = [ch]
-                    hgt = 1
-                    wid = len(ch)
-
-                    # speeds by size
-                    if size_choice == "small":
-                        speed = random.uniform(base_min_speed, base_min_speed + 0.08)
-                    else:  # medium
-                        speed = random.uniform(base_min_speed + 0.06, base_min_speed + 0.22)
-
-                    new_heart = Heart(
-                        x=col,
-                        y=2.0,  # start just below HUD
-                        color=random.choice(PINKS),
-                        speed=speed,
-                        size=size_choice,
-                        style=style_choice,
-                        sprite=sprite,
-                        w=wid,
-                        h=hgt,
-                        twinkle_phase=random.choice([0, 1, 2]),
-                        twinkle_next=now + random.uniform(0.1, 0.7),
-                    )
-
-                    # Check for collision with existing hearts
-                    collision = False
-                    for existing in hearts:
-                        if hearts_overlap(new_heart, existing):
-                            collision = True
-                            break
-
-                    # Only add if no collision
-                    if not collision:
-                        hearts.append(new_heart)
+            for col in spawn_columns(width, spawn_chance_per_col, rand):
+                # pick size and style
+                size_choice = _SIZE_POP[0] if rand() < SPAWN_BIAS else _SIZE_POP[1]
+                style_choice = _STYLE_POP[0] if rand() < SPAWN_BIAS else _STYLE_POP[1]
+
+                # choose heart glyph from the provided pools
+                if size_choice == "small":
+                    pool = HEARTS_SMALL if style_choice == "outline" else HEARTS_MED
+                    ch = rand_choice(pool)
+                else:  # medium
+                    ch = rand_choice(HEARTS_MED)
+
+                sprite = [ch]
+                hgt = 1
+                wid = len(ch)
+
+                # speeds by size
+                if size_choice == "small":
+                    speed = rand_uniform(base_min_speed, base_min_speed + 0.08)
+                else:  # medium
+                    speed = rand_uniform(base_min_speed + 0.06, base_min_speed + 0.22)
+
+                color = rand_choice(PINKS)
+                new_heart = Heart(
+                    x=col,
+                    y=2.0,  # start just below HUD
+                    color=color,
+                    speed=speed,
+                    size=size_choice,
+                    style=style_choice,
+                    sprite=sprite,
+                    w=wid,
+                    h=hgt,
+                    twinkle_phase=rand_choice(TWINKLE_PHASES),
+                    twinkle_next=now + int(rand_uniform(100_000_000, 700_000_000)),
+                    rendered=render_cells(color, ch),
+                )
+
+                # Only add if no collision with nearby hearts
+                bounds = heart_bounds(new_heart)
+                if not grid_collides(grid, bounds):
+                    hearts.append(new_heart)
+                    grid_add(grid, bounds)
 
             # Rotate message occasionally
-            t = time.perf_counter()
+            t = time.monotonic_ns()
             if t >= next_msg_time:
-                current_msg = random.choice(MESSAGES)
+                current_msg = rand_choice(MESSAGES)
                 # Space next message slightly randomly
-                next_msg_time = t + msg_duration + random.uniform(0.8, 2.2)
+                next_msg_time = t + msg_duration_ns + int(rand_uniform(800_000_000, 2_200_000_000))
 
-            draw_frame(hearts, current_msg)
+            draw_frame(hearts, current_msg, width, height)
 
             # Sleep for frame pacing
-            sleep_left = frame_time - (time.perf_counter() - now)
-            if sleep_left > 0:
-                time.sleep(sleep_left)
+            sleep_left_ns = frame_time_ns - (time.monotonic_ns() - now)
+            if sleep_left_ns > 0:
+                time.sleep(sleep_left_ns / 1e9)
     except KeyboardInterrupt:
         # Graceful exit
         sys.stdout.write(f"\n{CSI}2K\r\x1b[92mExiting love loop... See you next heartbeat! 💚{RESET}\n")